@@ -1,11 +1,22 @@
+import collections
+import dataclasses
 import datetime
-
-from flask_limiter import Limiter
-from flask import Flask, jsonify, request
+import functools
+import operator
+import os
+import threading
+import time
+
+import msgspec
+import limits
+import orjson
+from flask_limiter import Limiter, RateLimitExceeded
+from flask import Flask, request
 from flask_cors import CORS
 from flask_limiter.util import get_remote_address
+from flask_orjson import OrjsonProvider
 from flask_swagger_ui import get_swaggerui_blueprint
-from marshmallow import Schema, fields, ValidationError
+from werkzeug.exceptions import TooManyRequests
 
 """
 Masterblog API
@@ -16,40 +27,276 @@ rate limiting, validation, sorting, and searching, along with
 Swagger documentation for API reference.
 
 Features:
-- Rate Limiting: Limits API usage to prevent abuse (e.g., 10 requests per minute).
-- Validation: Ensures data integrity using Marshmallow.
+- Rate Limiting: Limits API usage to prevent abuse (e.g., 10 requests per minute
+  in a moving window). Clients that keep going over the limit are turned away
+  by a local token bucket without querying the rate-limit storage.
+- Validation: Ensures data integrity using msgspec.
+- Fast JSON: Responses are serialized with orjson directly; Flask-orjson covers
+  anything that still goes through Flask's JSON provider.
 - Swagger Documentation: Interactive API reference accessible at `/api/docs`.
 - Sorting and Filtering: Flexible query parameters for retrieving posts.
+- Response Caching: Sorted lists and search results are cached until the next write.
 - In-memory Data: Posts are stored temporarily in memory for simplicity (not persistent).
+  Writes publish a new immutable snapshot, so reads never need a lock.
 
 """
 
 app = Flask(__name__)
-limiter = Limiter(app=app, key_func=get_remote_address)
+app.json = OrjsonProvider(app)
+limiter = Limiter(app=app, key_func=get_remote_address,
+                  storage_uri=os.environ.get("RATELIMIT_STORAGE_URI",
+                                             "memory://"),
+                  strategy="moving-window")
 CORS(app)
 
-ID = "id"
 TITLE = "title"
 CONTENT = "content"
 AUTHOR = "author"
 DATE = "date"
 
+# Response formats of the post list
+JSON_MIMETYPE = "application/json"
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Fields that can be searched with search_posts
+SEARCH_FIELDS = [TITLE, CONTENT, AUTHOR, DATE]
+
+# Number of distinct searches whose matching post IDs are remembered
+SEARCH_CACHE_SIZE = 128
+
+# Number of clients whose local token buckets each rate-limited view keeps
+LOCAL_BUCKETS_SIZE = 10000
+
 # Sorting and Direction of Post
 DIRECTION_ASC = "asc"
 DIRECTION_DESC = "desc"
+SORT_DIRECTIONS = frozenset((DIRECTION_ASC, DIRECTION_DESC))
+
+
+# Sort key for each attribute posts can be sorted by. Dates are stored as
+# "YYYY-MM-DD", so comparing the strings compares the dates.
+SORT_KEYS = {
+    CONTENT: operator.attrgetter(CONTENT),
+    TITLE: operator.attrgetter(TITLE),
+    AUTHOR: operator.attrgetter(AUTHOR),
+    DATE: operator.attrgetter(DATE),
+}
+
 
-POSTS = [
-    {"id": 1, "title": "First post", "content": "This is the first post.",
-     "author": "Jerome", "date": "2023-06-07"},
-    {"id": 2, "title": "Second post", "content": "This is the second post.",
-     "author": "Savanna", "date": "2024-06-07"},
-]
+@dataclasses.dataclass(frozen=True, slots=True)
+class Post:
+    """
+    A blog post. Posts are immutable; an update replaces the post with a
+    modified copy. orjson serializes them as JSON objects directly.
+
+    Attributes:
+    -----------
+    id : int
+        The unique identifier of the post.
+    title : str
+        The title of the blog post.
+    content : str
+        The content of the blog post.
+    author : str
+        The author of the blog post.
+    date : str
+        The date of the blog post in "YYYY-MM-DD" format.
+    """
+    id: int
+    title: str
+    content: str
+    author: str
+    date: str
+
+
+class PostStore:
+    """
+    An immutable snapshot of all blog posts and the indexes built on them.
 
+    Published snapshots are never modified. Writers build a new snapshot
+    while holding POSTS_LOCK and publish it by assigning it to STORE, which
+    is atomic. Readers take STORE once per request and need no lock.
 
-def standard_error_response(status, error, error_code, message, details,
-                            path):
+    Attributes:
+    -----------
+    posts_by_id : dict
+        The posts indexed by their unique ID, in insertion order.
+    posts : tuple
+        The values of posts_by_id.
+    next_id : int
+        The ID assigned to the next created post.
+    version : int
+        Incremented by every write, so cached search results can tell
+        which snapshot they belong to.
+    sorted_views : dict
+        Sorted copies of posts keyed by (sort, direction), filled on demand.
+    json_bodies : dict
+        The posts serialized as JSON arrays keyed by (sort, direction), with
+        (None, None) for the unsorted posts, filled on demand.
+    """
+    __slots__ = ("posts_by_id", "posts", "next_id", "version",
+                 "sorted_views", "json_bodies")
+
+    def __init__(self, posts_by_id, next_id=None, version=0):
+        self.posts_by_id = posts_by_id
+        self.posts = tuple(posts_by_id.values())
+        self.next_id = (max(posts_by_id, default=0) + 1
+                        if next_id is None else next_id)
+        self.version = version
+        self.sorted_views = {}
+        self.json_bodies = {}
+
+    def with_post(self, post):
+        """
+        Returns a new snapshot that adds the post, or replaces the post with
+        the same ID.
+
+        Parameters:
+        -----------
+        post : Post
+            The post to add or replace.
+        """
+        posts_by_id = self.posts_by_id.copy()
+        posts_by_id[post.id] = post
+
+        return PostStore(posts_by_id, max(self.next_id, post.id + 1),
+                         self.version + 1)
+
+    def without_post(self, post_id):
+        """
+        Returns a new snapshot without the post with the given ID.
+
+        Parameters:
+        -----------
+        post_id : int
+            The unique identifier of the post to leave out.
+        """
+        posts_by_id = self.posts_by_id.copy()
+        del posts_by_id[post_id]
+
+        return PostStore(posts_by_id, self.next_id, self.version + 1)
+
+    def sorted_posts(self, sort, direction):
+        """
+        Returns the posts sorted by an attribute, reusing the result for
+        later requests on the same snapshot.
+
+        Parameters:
+        -----------
+        sort : str
+            The attribute to sort the posts by ("content", "title",
+            "author", "date").
+        direction : str
+            The direction to sort the posts ("asc" or "desc").
+        """
+        posts = self.sorted_views.get((sort, direction))
+
+        if posts is None:
+            posts = tuple(sorted(self.posts, key=SORT_KEYS[sort],
+                                 reverse=direction == DIRECTION_DESC))
+            self.sorted_views[(sort, direction)] = posts
+
+        return posts
+
+    def posts_json(self, sort=None, direction=None):
+        """
+        Returns the posts serialized as a JSON array, serializing each
+        ordering only once per snapshot.
+
+        Parameters:
+        -----------
+        sort : str, optional
+            The attribute to sort the posts by; unsorted if not given.
+        direction : str, optional
+            The direction to sort the posts ("asc" or "desc").
+        """
+        body = self.json_bodies.get((sort, direction))
+
+        if body is None:
+            posts = (self.posts if sort is None
+                     else self.sorted_posts(sort, direction))
+            body = orjson.dumps(posts)
+            self.json_bodies[(sort, direction)] = body
+
+        return body
+
+    def search(self, search_terms):
+        """
+        Returns the posts whose fields contain every search term.
+
+        The matching IDs are kept in SEARCH_CACHE under the snapshot's
+        version, so repeated searches, including those without matches,
+        are answered from memory until the next write.
+
+        Parameters:
+        -----------
+        search_terms : dict
+            The substring to look for, keyed by field name.
+        """
+        # Longer terms are more selective, so they are checked first and
+        # the substring test fails early
+        terms = tuple(sorted(search_terms.items(),
+                             key=lambda item: (-len(item[1]), item[0])))
+        key = (self.version, terms)
+
+        with SEARCH_CACHE_LOCK:
+            post_ids = SEARCH_CACHE.get(key)
+
+            if post_ids is not None:
+                SEARCH_CACHE.move_to_end(key)
+
+        if post_ids is None:
+            post_ids = self.find_matching_ids(terms)
+
+            with SEARCH_CACHE_LOCK:
+                SEARCH_CACHE[key] = post_ids
+
+                if len(SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+                    SEARCH_CACHE.popitem(last=False)
+
+        return [self.posts_by_id[post_id] for post_id in post_ids]
+
+    def find_matching_ids(self, search_terms):
+        """
+        Returns the IDs of the posts whose fields contain every search term.
+
+        Parameters:
+        -----------
+        search_terms : tuple
+            (field, substring) pairs to look for, most selective first.
+        """
+        return tuple(post.id for post in self.posts
+                     if all(term in getattr(post, field)
+                            for field, term in search_terms))
+
+
+# The current snapshot of the posts; replaced as a whole on every write
+STORE = PostStore({
+    1: Post(id=1, title="First post", content="This is the first post.",
+            author="Jerome", date="2023-06-07"),
+    2: Post(id=2, title="Second post", content="This is the second post.",
+            author="Savanna", date="2024-06-07"),
+})
+
+# Serializes writers while they build and publish a new STORE
+POSTS_LOCK = threading.Lock()
+
+# Matching post IDs keyed by (snapshot version, search terms), least
+# recently used first; entries of replaced snapshots age out
+SEARCH_CACHE = collections.OrderedDict()
+SEARCH_CACHE_LOCK = threading.Lock()
+
+# Last (second, ISO 8601 string) pair returned by current_timestamp
+_timestamp_cache = (0, "")
+
+
+def error_response_template(status, error, error_code, message, path):
     """
-    Constructs a standardized error response dictionary.
+    Pre-serializes the fixed fields of a standardized error response.
+
+    Templates are built once at import time. The result is the HTTP status
+    and the JSON body up to the value of "details", which
+    standard_error_response completes for each error.
 
     Parameters:
     -----------
@@ -61,19 +308,88 @@ def standard_error_response(status, error, error_code, message, details,
         A unique code representing the specific error (e.g., "VALIDATION_ERROR").
     message : str
         A detailed error message providing context about the error.
-    details : str
-        Additional information or debug details about the error.
     path : str
         The API path or endpoint where the error occurred.
     """
-    return {
+    fields = orjson.dumps({
         "status": f"{status}",
         "error": f"{error}",
         "errorCode": f"{error_code}",
         "message": f"{message}",
-        "details": f"{details}",
         "path": f"{path}"
-    }
+    })
+
+    return status, fields[:-1] + b',"details":'
+
+
+ERROR_VALIDATION = error_response_template(
+    400, "Bad Request", "VALIDATION_ERROR_MISSING_TITLE_CONTENT",
+    "Validation failed.", "/api/v1/posts")
+ERROR_INVALID_DIRECTION = error_response_template(
+    400, "Bad Request", "VALIDATION_ERROR_INVALID_DIRECTION",
+    "Validation failed.", "/api/v1/posts")
+ERROR_INVALID_SORT = error_response_template(
+    400, "Bad Request", "VALIDATION_ERROR_INVALID_SORT",
+    "Validation failed.", "/api/v1/posts")
+ERROR_NOT_FOUND = error_response_template(
+    404, "Not Found", "RESOURCE_NOT_FOUND",
+    "The requested resource could not be found.", "/api/v1/posts")
+
+
+def standard_error_response(template, details):
+    """
+    Constructs a standardized error response from a template.
+
+    Only the details are serialized per call; they are encoded with orjson,
+    so quotes and other special characters are escaped correctly.
+
+    Parameters:
+    -----------
+    template : tuple
+        The status and body prefix of the error, as built by
+        error_response_template.
+    details : str
+        Additional information or debug details about the error.
+    """
+    status, body_prefix = template
+
+    return app.response_class(
+        body_prefix + orjson.dumps(f"{details}") + b"}",
+        status=status, mimetype=JSON_MIMETYPE)
+
+
+def current_timestamp():
+    """
+    Returns the current local time as an ISO 8601 string, to the second.
+
+    The string is formatted once per second and reused by every call within
+    that second.
+    """
+    global _timestamp_cache
+
+    second = int(time.time())
+    cached_second, timestamp = _timestamp_cache
+
+    if second != cached_second:
+        timestamp = datetime.datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, timestamp)
+
+    return timestamp
+
+
+def json_response(data, status=200):
+    """
+    Serializes data with orjson into a JSON response.
+
+    Parameters:
+    -----------
+    data : object
+        The data to send, e.g. a dict, a list or a Post.
+    status : int, optional
+        The HTTP status code of the response.
+    """
+    return app.response_class(orjson.dumps(data), status=status,
+                              mimetype=JSON_MIMETYPE)
 
 
 def jsonify_response(payload):
@@ -88,37 +404,227 @@ def jsonify_response(payload):
     """
     return {
         "posts": payload,
-        "createdAt": datetime.datetime.now().isoformat()
+        "createdAt": current_timestamp()
     }
 
 
-class ItemSchema(Schema):
+def post_list_response(store, sort=None, direction=None):
+    """
+    Builds the response for the list of posts of a snapshot.
+
+    The posts are streamed as newline-delimited JSON (one post per line) if
+    the client prefers application/x-ndjson. Otherwise the snapshot's cached
+    JSON array is sent.
+
+    Parameters:
+    -----------
+    store : PostStore
+        The snapshot whose posts are sent.
+    sort : str, optional
+        The attribute to sort the posts by; unsorted if not given.
+    direction : str, optional
+        The direction to sort the posts ("asc" or "desc").
+    """
+    mimetype = request.accept_mimetypes.best_match(
+        [JSON_MIMETYPE, NDJSON_MIMETYPE], default=JSON_MIMETYPE)
+
+    if mimetype == NDJSON_MIMETYPE:
+        posts = (store.posts if sort is None
+                 else store.sorted_posts(sort, direction))
+        body = (orjson.dumps(post) + b"\n" for post in posts)
+    else:
+        body = store.posts_json(sort, direction)
+
+    response = app.response_class(body, mimetype=mimetype)
+    # The format depends on Accept, so caches must not mix the two up
+    response.vary.add("Accept")
+
+    return response
+
+
+class Item(msgspec.Struct, forbid_unknown_fields=True):
     """
     Defines the schema for validating blog post data.
 
+    The schema is compiled by msgspec, which validates request bodies while
+    decoding them.
+
     Fields:
     -------
-    title : fields.Str
+    title : str
         The title of the blog post. This field is required.
-    content : fields.Str
+    content : str
         The content of the blog post. This field is required.
-    author : fields.Str
+    author : str
         The author of the blog post. This field is required.
-    date : fields.Str
-        The date of the blog post in string format (e.g., "YYYY-MM-DD").
-        This field is required.
+    date : str
+        The date of the blog post in "YYYY-MM-DD" format. This field is
+        required.
+    """
+    title: str
+    content: str
+    author: str
+    date: str
+
+    def __post_init__(self):
+        # Only the canonical form is accepted, so dates sort as strings
+        try:
+            parsed = datetime.date.fromisoformat(self.date)
+            valid = parsed.isoformat() == self.date
+        except ValueError:
+            valid = False
+
+        if not valid:
+            raise ValueError(
+                "`date` is not a valid date in YYYY-MM-DD format")
+
+
+def load_item(data):
+    """
+    Decodes and validates a JSON request body as blog post data.
+
+    Raises msgspec.DecodeError if the body is not valid JSON or does not
+    match the Item schema.
+
+    Parameters:
+    -----------
+    data : bytes
+        The raw JSON request body.
+    """
+    return msgspec.structs.asdict(msgspec.json.decode(data, type=Item))
+
+
+class LocalTokenBucket:
+    """
+    An in-process token bucket for one client.
+
+    Attributes:
+    -----------
+    tokens : float
+        The number of requests the client may currently make.
+    last : float
+        The monotonic time at which tokens was last refilled.
+    rate : float
+        The number of tokens added per second.
+    capacity : float
+        The maximum number of tokens.
+    blocked_until : float
+        The monotonic time until which every request is rejected, because
+        the shared limit has no room for the client before then.
+    """
+    __slots__ = ("tokens", "last", "rate", "capacity", "blocked_until")
+
+    def __init__(self, rate, capacity):
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.rate = rate
+        self.capacity = capacity
+        self.blocked_until = 0.0
+
+    def acquire(self, now):
+        """
+        Refills the bucket up to now and takes a token if one is left and
+        the bucket is not blocked.
+
+        Returns True if a token was taken.
+
+        Parameters:
+        -----------
+        now : float
+            The current monotonic time.
+        """
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+        if now < self.blocked_until or self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+    def block(self, until):
+        """
+        Gives back the token of a request the shared limit rejected and
+        rejects every request until the given time.
+
+        Parameters:
+        -----------
+        until : float
+            The monotonic time at which requests may be accepted again.
+        """
+        self.tokens = min(self.capacity, self.tokens + 1)
+        self.blocked_until = max(self.blocked_until, until)
+
+
+def rate_limit(limit_value):
+    """
+    Limits a view per client, first locally and then with flask-limiter.
+
+    Each client gets a token bucket that refills at the rate of
+    limit_value. Requests that find a token go on to flask-limiter, which
+    stays authoritative. When it rejects one, the bucket is blocked until
+    the shared window has room again. Requests that meet an empty or
+    blocked bucket are rejected with 429 without querying the rate-limit
+    storage, so a client that keeps going over the limit costs one
+    storage query per window. The block never outlasts the shared
+    window, so the local check is never stricter than flask-limiter.
+
+    Parameters:
+    -----------
+    limit_value : str
+        The limit in flask-limiter notation, e.g. "10/minute".
     """
-    title = fields.Str(required=True)
-    content = fields.Str(required=True)
-    author = fields.Str(required=True)
-    date = fields.Str(required=True)
+    item = limits.parse(limit_value)
+    rate = item.amount / item.get_expiry()
+
+    def decorator(view):
+        limited_view = limiter.limit(limit_value)(view)
+        buckets = collections.OrderedDict()
+        buckets_lock = threading.Lock()
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if not limiter.enabled:
+                return limited_view(*args, **kwargs)
+
+            client = get_remote_address()
+
+            with buckets_lock:
+                bucket = buckets.get(client)
+
+                if bucket is None:
+                    bucket = LocalTokenBucket(rate, item.amount)
+                    buckets[client] = bucket
+
+                    if len(buckets) > LOCAL_BUCKETS_SIZE:
+                        buckets.popitem(last=False)
+                else:
+                    buckets.move_to_end(client)
 
+                acquired = bucket.acquire(time.monotonic())
 
-schema = ItemSchema()
+            if not acquired:
+                raise TooManyRequests(str(item))
+
+            try:
+                return limited_view(*args, **kwargs)
+            except RateLimitExceeded:
+                # reset_at rounds the end of the shared window up to the
+                # next second, so a second earlier never outlasts it
+                delay = limiter.current_limit.reset_at - 1 - time.time()
+
+                with buckets_lock:
+                    bucket.block(time.monotonic() + delay)
+                raise
+
+        return wrapper
+
+    return decorator
 
 
 @app.route('/api/v1/posts', methods=['GET', 'POST'])
-@limiter.limit("10/minute")
+@rate_limit("10/minute")
 def get_posts():
     """
     Handles requests to the '/api/v1/posts' endpoint for retrieving or creating posts.
@@ -134,7 +640,7 @@ def get_posts():
 
     POST:
         - Creates a new blog post.
-        - Validates the input data using the `ItemSchema`.
+        - Validates the input data using the `Item` schema.
         - Automatically assigns a unique ID to the new post.
 
 
@@ -145,77 +651,38 @@ def get_posts():
     direction : str, optional
         The direction to sort the posts ("asc" for ascending, "desc" for descending).
     """
+    global STORE
+
     if request.method == 'POST':
         try:
-            new_post = schema.load(request.get_json())
-
-            new_id = max(post['id'] for post in POSTS) + 1
-            new_post['id'] = new_id
+            new_data = load_item(request.get_data(cache=False))
 
-            POSTS.append(new_post)
+            with POSTS_LOCK:
+                new_post = Post(id=STORE.next_id, **new_data)
+                STORE = STORE.with_post(new_post)
 
-            return jsonify(jsonify_response(new_post)), 201
-        except ValidationError as err:
-            return jsonify(
-                standard_error_response(400,
-                                        "Bad Request",
-                                        "VALIDATION_ERROR_MISSING_TITLE_CONTENT",
-                                        "Validation failed.",
-                                        f"{err}",
-                                        "/api/v1/posts"
-
-                                        )), 400
+            return json_response(jsonify_response(new_post), 201)
+        except msgspec.DecodeError as err:
+            return standard_error_response(ERROR_VALIDATION, err)
 
     else:
-        options_directions = [DIRECTION_ASC, DIRECTION_DESC]
-        options_sort = [CONTENT, TITLE, AUTHOR, DATE]
-
         sort = request.args.get('sort')
         direction = request.args.get('direction')
 
         if direction is None and sort is None:
-            return jsonify(POSTS)
-
-        if direction not in options_directions:
-            return jsonify(
-                standard_error_response(400,
-                                        "Bad Request",
-                                        "VALIDATION_ERROR_INVALID_DIRECTION",
-                                        "Validation failed.",
-                                        f"The direction field is invalid. [{direction}]",
-                                        "/api/v1/posts"
-
-                                        )), 400
-
-        if sort not in options_sort:
-            return jsonify(
-                standard_error_response(400,
-                                        "Bad Request",
-                                        "VALIDATION_ERROR_INVALID_SORT",
-                                        "Validation failed.",
-                                        f"The sort field is invalid. [{sort}]",
-                                        "/api/v1/posts"
-
-                                        )), 400
-
-        if sort and direction:
-            if direction == "desc":
-                if sort == DATE:
-                    return jsonify(
-                        sorted(POSTS,
-                               key=lambda post: datetime.date.fromisoformat(
-                                   post[sort]),
-                               reverse=True))
-
-                return jsonify(
-                    sorted(POSTS, key=lambda post: post[sort], reverse=True))
-            else:
-                if sort == DATE:
-                    return jsonify(sorted(POSTS, key=lambda
-                        post: datetime.date.fromisoformat(
-                        post[sort])))
-
-                return jsonify(sorted(POSTS, key=lambda post: post[sort]))
+            return post_list_response(STORE)
+
+        if direction not in SORT_DIRECTIONS:
+            return standard_error_response(
+                ERROR_INVALID_DIRECTION,
+                f"The direction field is invalid. [{direction}]")
+
+        if sort not in SORT_KEYS:
+            return standard_error_response(
+                ERROR_INVALID_SORT,
+                f"The sort field is invalid. [{sort}]")
+
+        return post_list_response(STORE, sort, direction)
 
 
 def find_post_by_id(post_id):
@@ -227,13 +694,11 @@ def find_post_by_id(post_id):
     post_id : int
         The unique identifier of the post to search for.
     """
-    post = [post for post in POSTS if post[ID] == post_id]
-
-    return post[0] if post else None
+    return STORE.posts_by_id.get(post_id)
 
 
 @app.route('/api/v1/posts/<int:id>', methods=['DELETE'])
-@limiter.limit("10/minute")
+@rate_limit("10/minute")
 def delete_post(id):
     """
     Deletes a blog post by its unique ID.
@@ -251,27 +716,25 @@ def delete_post(id):
         - If no post is found with the provided ID:
           A standardized error response with status 404.
     """
-    post = find_post_by_id(id)
+    global STORE
+
+    with POSTS_LOCK:
+        post = find_post_by_id(id)
+
+        if post is not None:
+            STORE = STORE.without_post(id)
 
     if post is None:
-        return jsonify(
-            standard_error_response(404,
-                                    "Not Found",
-                                    "RESOURCE_NOT_FOUND",
-                                    "The requested resource could not be found.",
-                                    [
-                                        f"No records match the provided ID {id}."],
-                                    "/api/v1/posts"
-                                    )), 404
-
-    POSTS.remove(post)
-
-    return jsonify(
+        return standard_error_response(
+            ERROR_NOT_FOUND,
+            [f"No records match the provided ID {id}."])
+
+    return json_response(
         {"message": f"Post with id {id} has been deleted successfully."})
 
 
 @app.route('/api/v1/posts/<int:id>', methods=['PUT'])
-@limiter.limit("10/minute")
+@rate_limit("10/minute")
 def handle_post(id):
     """
     Updates an existing blog post by its unique ID.
@@ -290,46 +753,43 @@ def handle_post(id):
           A standardized error response with status 404.
         - If validation fails: A standardized error response with status 400.
     """
-    post = find_post_by_id(id)
+    global STORE
 
-    if post is None:
-        return jsonify(
-            standard_error_response(404,
-                                    "Not Found",
-                                    "RESOURCE_NOT_FOUND",
-                                    "The requested resource could not be found.",
-                                    [
-                                        f"No records match the provided ID {id}."],
-                                    "/api/v1/posts"
-                                    )), 404
+    if find_post_by_id(id) is None:
+        return standard_error_response(
+            ERROR_NOT_FOUND,
+            [f"No records match the provided ID {id}."])
 
     try:
-        new_data = schema.load(request.get_json())
-    except ValidationError as err:
-        return jsonify(
-            standard_error_response(400,
-                                    "Bad Request",
-                                    "VALIDATION_ERROR_MISSING_TITLE_CONTENT",
-                                    "Validation failed.",
-                                    f"{err}",
-                                    "/api/v1/posts"
-                                    )), 400
+        new_data = load_item(request.get_data(cache=False))
+    except msgspec.DecodeError as err:
+        return standard_error_response(ERROR_VALIDATION, err)
 
-    post[TITLE] = new_data.get(TITLE, post[TITLE])
-    post[CONTENT] = new_data.get(CONTENT, post[CONTENT])
-    post[AUTHOR] = new_data.get(AUTHOR, post[AUTHOR])
-    post[DATE] = new_data.get(DATE, post[DATE])
+    with POSTS_LOCK:
+        post = find_post_by_id(id)
 
-    return jsonify(post)
+        if post is not None:
+            post = dataclasses.replace(post, **new_data)
+            STORE = STORE.with_post(post)
+
+    # The post was deleted while the request body was being validated
+    if post is None:
+        return standard_error_response(
+            ERROR_NOT_FOUND,
+            [f"No records match the provided ID {id}."])
+
+    return json_response(post)
 
 
 @app.route('/api/v1/posts/search', methods=['GET'])
-@limiter.limit("10/minute")
+@rate_limit("10/minute")
 def search_posts():
     """
     Searches for blog posts based on query parameters.
 
-    If no matching posts are found, an empty list is returned.
+    A post matches when every given parameter is a substring of the
+    corresponding field. If no parameters are given or no matching posts
+    are found, an empty list is returned.
 
     Query Parameters:
     -----------------
@@ -345,85 +805,26 @@ def search_posts():
     Returns:
     --------
     JSON Response:
-        - A list of posts matching the search criteria, or an empty list if no matches are found.
+        - A list of posts matching all search criteria, or an empty list if no matches are found.
 
     Response Codes:
     ---------------
     - 200: Successfully returned the filtered list of posts.
 
     """
-    title = request.args.get(TITLE)
-    content = request.args.get(CONTENT)
-    author = request.args.get(AUTHOR)
-    date_post = request.args.get(DATE)
-
-    if title and content:
-        filtered_title_content = [post for post in POSTS if
-                                  (title in post.get(TITLE))
-                                  and (content in post.get(CONTENT))
-                                  ]
-
-        if filtered_title_content:
-            return jsonify(filtered_title_content)
-
-    if title and author:
-        filtered_title_author = [post for post in POSTS if
-                                 (title in post.get(TITLE))
-                                 and (author in post.get(AUTHOR))
-                                 ]
-
-        if filtered_title_author:
-            return jsonify(filtered_title_author)
-
-    if title and date_post:
-        filtered_title_date_post = [post for post in POSTS if
-                                    (title in post.get(TITLE))
-                                    and (date_post in post.get(DATE))
-                                    ]
-
-        if filtered_title_date_post:
-            return jsonify(filtered_title_date_post)
-
-    if title and content and author and date_post:
-        filtered_title_content = [post for post in POSTS if
-                                  (title in post.get(TITLE))
-                                  and (content in post.get(CONTENT))
-                                  and (author in post.get(AUTHOR))
-                                  and (date_post in post.get(DATE))
-                                  ]
-
-        if filtered_title_content:
-            return jsonify(filtered_title_content)
-
-    if title:
-        filtered_title = [post for post in POSTS if
-                          title in post.get(TITLE)]
-
-        if filtered_title:
-            return jsonify(filtered_title)
-
-    if content:
-        filtered_content = [post for post in POSTS if
-                            content in post.get(CONTENT)]
-
-        if filtered_content:
-            return jsonify(filtered_content)
-
-    if author:
-        filtered_author = [post for post in POSTS if
-                           author in post.get(AUTHOR)]
+    args = request.args
+    search_terms = {}
 
-        if filtered_author:
-            return jsonify(filtered_author)
+    for field in SEARCH_FIELDS:
+        term = args.get(field)
 
-    if date_post:
-        filtered_date_post = [post for post in POSTS if
-                              date_post in post.get(DATE)]
+        if term:
+            search_terms[field] = term
 
-        if filtered_date_post:
-            return jsonify(filtered_date_post)
+    if not search_terms:
+        return json_response([])
 
-    return jsonify([])
+    return json_response(STORE.search(search_terms))
 
 
 SWAGGER_URL = "/api/docs"
@@ -439,4 +840,5 @@ swagger_ui_blueprint = get_swaggerui_blueprint(
 app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)
 
 if __name__ == '__main__':
-    app.run(host="0.0.0.0", port=5002, debug=True)
+    app.run(host="0.0.0.0", port=5002,
+            debug=os.environ.get("FLASK_DEBUG") == "1")
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the Masterblog API.
+
+Start the server from the `backend` directory with:
+
+    gunicorn backend_app:app
+
+The gevent worker monkey-patches the standard library before the app is
+imported, so a single worker serves many concurrent connections using
+greenlets. The API only does in-memory work and socket I/O (no blocking C
+extensions such as unpatched database drivers), which makes gevent safe here.
+
+Posts are stored in process memory, so the API must run as a single worker
+process; additional workers would each hold their own copy of the posts.
+"""
+
+bind = "0.0.0.0:5002"
+worker_class = "gevent"
+workers = 1
+worker_connections = 1000